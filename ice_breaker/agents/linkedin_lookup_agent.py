@@ -7,7 +7,7 @@ profile URLs given a person's name. It demonstrates several advanced LangChain c
 1. ReAct Agent Pattern: The agent can reason about what to do and take actions iteratively
 2. Tool Integration: Uses web search tools to perform external actions
 3. Agent Executor: Manages the agent's reasoning loop and tool execution
-4. LangChain Hub: Leverages pre-built prompts from the community
+4. LangChain Hub: Leverages pre-built prompts from the community (bundled as a local snapshot)
 
 ReAct Process Flow:
 1. Agent receives a name and reasoning prompt
@@ -17,31 +17,132 @@ ReAct Process Flow:
 5. Agent returns the final LinkedIn profile URL
 
 This pattern is powerful for multi-step tasks that require external data gathering.
+For the common case a single direct search already returns the profile, so the
+agent is kept as a fallback for names the direct search cannot resolve.
 """
 
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import PromptTemplate
 from langchain_core.tools import Tool
-from langchain.agents import (create_react_agent, AgentExecutor, AgentType)
+from langchain.agents import create_react_agent, AgentExecutor
 from langchain import hub
 
 import os
 import sys
-from dotenv import load_dotenv
+from typing import Optional
+
+import diskcache
 
 # Fix import path issue - allows importing from sibling directories
 # This is needed because the agents/ directory needs to access tools/ directory
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from tools.tools import get_profile_url_tavily
+from tools.tools import get_profile_url_tavily, find_profile_url_tavily, find_linkedin_profile_urls
+from exact_cache import normalize_name
+
+# Agent Components (built once at import)
+# Everything below is identical for every lookup, so it is constructed a single
+# time per process instead of on every call; lookup() only runs the executor.
+
+# Initialize Language Model for Agent Reasoning
+# Using deterministic output (temperature=0) for consistent results
+# prompt_cache_key is sent via extra_body so it reaches the API whatever the openai
+# SDK version; the ReAct prefix is a few hundred tokens, under OpenAI's 1024-token
+# caching minimum, so it only pays off if the prompt or tool list grows
+_LLM = ChatOpenAI(
+    model="gpt-4o-mini",
+    temperature=0,
+    extra_body={"prompt_cache_key": "icebreaker-lookup-v1"},
+)
+
+# Define the Agent's Task Template
+# This tells the agent what its goal is and how to format the response
+# The name comes last so the instructions stay identical across calls
+_TEMPLATE = """
+    I want you to get back the LinkedIn profile URL of a person. Your answer should ONLY contain a URL.
+    If you cannot find it, return an empty string.
+    Full name: {name_of_person}
+"""
+
+# Create Prompt Template for Agent Task
+# This will be formatted with the person's name at runtime
+_PROMPT_TEMPLATE = PromptTemplate(
+    input_variables=["name_of_person"],
+    template=_TEMPLATE,
+)
+
+# Define Tools Available to the Agent
+# Tools are external functions the agent can call during reasoning
+_TOOLS = [
+    Tool(
+        name="crawl Google 4 linkedin profile",  # Tool identifier for agent
+        func=get_profile_url_tavily,              # Actual function to execute
+        description="useful when you need to find LinkedIn profile URL from a person's name"  # Helps agent decide when to use this tool
+    )
+]
+
+# Load Pre-built ReAct Prompt (snapshot of hwchase17/react from LangChain Hub)
+# This is a community-maintained prompt that implements the ReAct pattern
+# It teaches the agent how to reason step-by-step and use tools
+# Its instructions and tool descriptions precede {input}, keeping the prefix static
+_REACT_PROMPT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "prompts", "react.txt"
+)
+
+
+def _load_react_prompt() -> PromptTemplate:
+    """
+    Loads the ReAct prompt from the local snapshot, falling back to LangChain Hub.
+    
+    Reading the bundled copy avoids a network round-trip to the Hub at startup;
+    the Hub is only contacted if the snapshot is missing or unreadable.
+    
+    Returns:
+        PromptTemplate: ReAct prompt with tools, tool_names, input and agent_scratchpad
+    """
+    try:
+        with open(_REACT_PROMPT_PATH, encoding="utf-8") as f:
+            # The Hub template ends right after "Thought:{agent_scratchpad}"
+            return PromptTemplate.from_template(f.read().rstrip("\n"))
+    except OSError:
+        return hub.pull("hwchase17/react")
+
 
-load_dotenv()
+_REACT_PROMPT = _load_react_prompt()
 
+# Create ReAct Agent
+# The agent combines the LLM, tools, and ReAct prompt to enable reasoning
+_AGENT = create_react_agent(
+    llm=_LLM,                   # Language model for reasoning
+    tools=_TOOLS,               # Available tools/actions
+    prompt=_REACT_PROMPT,       # ReAct reasoning template
+)
 
-def lookup(name: str) -> str: 
+# Create Agent Executor
+# This manages the agent's execution loop, handling tool calls and reasoning iterations
+# Set verbose=True to print the agent's reasoning process (useful for debugging)
+_EXECUTOR = AgentExecutor(agent=_AGENT, tools=_TOOLS, verbose=False)
+
+
+# LinkedIn URL Cache
+# The same name always maps to the same profile, so resolved URLs are kept in a
+# diskcache store (SQLite-backed, safe to share between gunicorn worker processes).
+# Only answers that look like a profile URL are cached for good; anything else
+# is cached as a miss (an empty string) for an hour, so unfindable names don't
+# rerun the agent on every request.
+_URL_CACHE = diskcache.Cache("./.icebreaker_cache/linkedin_urls")
+_NEGATIVE_TTL_SECONDS = 60 * 60
+
+
+def lookup(name: str, use_agent: bool = False) -> str: 
     """
-    Uses a ReAct agent to find a person's LinkedIn profile URL.
+    Finds a person's LinkedIn profile URL, using a ReAct agent when needed.
+    
+    A single direct Tavily search usually returns the profile as its first hit,
+    so that is tried first; the agent only runs when no result looks like a
+    LinkedIn profile URL (or when use_agent=True). Resolved URLs are cached by
+    normalized name; names that could not be resolved are retried after an hour.
     
-    This function demonstrates the ReAct (Reasoning + Acting) pattern where an AI agent:
+    The agent path demonstrates the ReAct (Reasoning + Acting) pattern where an AI agent:
     1. Reasons about what action to take
     2. Acts by using available tools
     3. Observes the results
@@ -49,9 +150,13 @@ def lookup(name: str) -> str:
     
     Args:
         name (str): Full name of the person to search for
+        use_agent (bool): If True, skips the direct search and always runs the agent
         
     Returns:
-        str: LinkedIn profile URL or empty string if not found
+        str: LinkedIn profile URL (matching LINKEDIN_PROFILE_URL_RE) or empty string if not found
+        
+    Raises:
+        RuntimeError: If the direct Tavily search fails; nothing is cached then
         
     LangChain Components:
     - ReAct Agent: Multi-step reasoning with tool usage
@@ -59,62 +164,69 @@ def lookup(name: str) -> str:
     - Agent Executor: Manages the agent's execution loop
     - LangChain Hub: Uses community-maintained prompts
     """
+    # use_agent=True always re-resolves (and refreshes the cached entry)
+    if not use_agent:
+        cached = _get_cached_url(name)
+        if cached is not None:
+            return cached
     
-    # Initialize Language Model for Agent Reasoning
-    # Using deterministic output (temperature=0) for consistent results
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
-    
-    # Define the Agent's Task Template
-    # This tells the agent what its goal is and how to format the response
-    template = """
-        given the full name {name_of_person}, I want you to get back the LinkedIn profile URL. Your answer should ONLY contain a URL.
-        If you cannot find it, return an empty string.
-    """
+    linkedin_profile_url = _extract_profile_url(_lookup_uncached(name, use_agent))
+    _cache_url(name, linkedin_profile_url)
+    return linkedin_profile_url
 
-    # Create Prompt Template for Agent Task
-    # This will be formatted with the person's name at runtime
-    prompt_template = PromptTemplate(
-        input_variables=["name_of_person"],
-        template=template,
-    )
-    
-    # Define Tools Available to the Agent
-    # Tools are external functions the agent can call during reasoning
-    tools_for_agent = [
-        Tool(
-            name="crawl Google 4 linkedin profile",  # Tool identifier for agent
-            func=get_profile_url_tavily,              # Actual function to execute
-            description="useful when you need to find LinkedIn profile URL from a person's name"  # Helps agent decide when to use this tool
-        )
-    ]
-
-    # Load Pre-built ReAct Prompt from LangChain Hub
-    # This is a community-maintained prompt that implements the ReAct pattern
-    # It teaches the agent how to reason step-by-step and use tools
-    react_prompt = hub.pull("hwchase17/react")
-    
-    # Create ReAct Agent
-    # The agent combines the LLM, tools, and ReAct prompt to enable reasoning
-    agent = create_react_agent(
-        llm=llm,                    # Language model for reasoning
-        tools=tools_for_agent,      # Available tools/actions
-        prompt=react_prompt,        # ReAct reasoning template
-    )
 
-    # Create Agent Executor
-    # This manages the agent's execution loop, handling tool calls and reasoning iterations
-    # verbose=True shows the agent's reasoning process (useful for debugging)
-    agent_executor = AgentExecutor(agent=agent, tools=tools_for_agent, verbose=True)
+def _lookup_uncached(name: str, use_agent: bool) -> str:
+    """
+    Resolves the profile URL without consulting the URL cache.
+    """
+    # Fast Path: One Search, No LLM Calls
+    # The agent would spend 1-3 LLM turns to read the same first search result
+    if not use_agent:
+        linkedin_profile_url = find_profile_url_tavily(name)
+        if linkedin_profile_url is None:
+            # Search outage or rate limit: the agent would hit the same failing tool,
+            # and raising keeps the name out of the negative cache
+            raise RuntimeError(f"LinkedIn profile search failed for {name!r}")
+        if linkedin_profile_url:
+            return linkedin_profile_url
     
     # Execute Agent with Task
     # The agent will iteratively reason and act until it finds the LinkedIn URL
-    result = agent_executor.invoke({"input": prompt_template.format_prompt(name_of_person=name)})
+    result = _EXECUTOR.invoke({"input": _PROMPT_TEMPLATE.format_prompt(name_of_person=name)})
 
     # Extract Final Answer
     # The agent executor returns a dictionary with the final output
     linkedin_profile_url = result["output"]
     return linkedin_profile_url
 
+
+def forget_linkedin_url(name: str) -> None:
+    """
+    Invalidates the cached profile URL for a name.
+    
+    Args:
+        name (str): Full name of the person
+    """
+    _URL_CACHE.delete(normalize_name(name))
+
+
+def _extract_profile_url(output: str) -> str:
+    # The agent's final answer is free text ("Agent stopped due to iteration limit",
+    # a sentence around the URL, ...); keep only a real profile URL, else a miss
+    urls = find_linkedin_profile_urls(output or "")
+    return urls[0] if urls else ""
+
+
+def _get_cached_url(name: str) -> Optional[str]:
+    # Returns the cached URL ("" for a fresh negative entry) or None on a miss;
+    # negative entries expire on their own after _NEGATIVE_TTL_SECONDS
+    return _URL_CACHE.get(normalize_name(name))
+
+
+def _cache_url(name: str, linkedin_profile_url: str) -> None:
+    expire = None if linkedin_profile_url else _NEGATIVE_TTL_SECONDS
+    _URL_CACHE.set(normalize_name(name), linkedin_profile_url, expire=expire)
+
 if __name__ == "__main__":
     # Example usage: Find LinkedIn profile URL
     linkedin_url = lookup(name="Yannick Folla")
@@ -1,27 +1,124 @@
-from dotenv import load_dotenv
-from flask import Flask, request, jsonify, render_template
-from ice_breaker import ice_break_with
-
-load_dotenv()
+import orjson
+from flask import Flask, Response, abort, request, render_template, stream_with_context
+from ice_breaker import (
+    fetch_linkedin_data,
+    get_cached_result,
+    ice_break_with_batch,
+    store_result,
+    stream_summary,
+)
+from output_parsers import Summary
 
 app = Flask(__name__)
 
+PLACEHOLDER_PICTURE_URL = "https://via.placeholder.com/300x300?text=No+Image"
+
+# Largest batch accepted by /process_batch; each name can cost several API calls
+MAX_BATCH_SIZE = 25
+
+
+def build_payload(summary: Summary, photo_url):
+    return {
+        "summary_and_facts": summary.model_dump(),
+        "picture_url": photo_url or PLACEHOLDER_PICTURE_URL,
+        "ice_breakers": {"ice_breakers": ["Coming soon..."]},
+        "interests": {"topics_of_interest": ["Coming soon..."]}
+    }
+
+
+def json_response(payload) -> Response:
+    # orjson serializes in Rust and emits compact bytes (no whitespace)
+    return Response(orjson.dumps(payload), mimetype="application/json")
+
+
+def sse_event(event: str, data) -> str:
+    # Server-Sent Events frame: named event plus a single-line JSON payload
+    return f"event: {event}\ndata: {orjson.dumps(data).decode()}\n\n"
+
+
 @app.route("/")
 def index():
     return render_template("index.html")
 
 @app.route("/process", methods=["POST"])
 def process():
+    """
+    Streams ice-breaker content for a name as Server-Sent Events.
+
+    Events:
+    - profile: {"picture_url": ...} as soon as the LinkedIn data is scraped
+    - summary: partial {"summary": ..., "facts": [...]} while the LLM generates
+    - result: the complete payload, sent last (and alone on a cache hit)
+    - error: {"message": ...} instead of result if generation fails
+    """
     data = request.form
-    name = data.get("name")
-    summary, photo_url = ice_break_with(name=name)
-    return jsonify({
-        "summary_and_facts": summary.to_dict(),
-        "picture_url": photo_url or "https://via.placeholder.com/300x300?text=No+Image",
-        "ice_breakers": {"ice_breakers": ["Coming soon..."]},
-        "interests": {"topics_of_interest": ["Coming soon..."]}
-    })
+    name = data.get("name", "")
+    if not name.strip():
+        abort(400, description="Expected a non-empty name")
+
+    response = Response(stream_with_context(_generate_events(name)), mimetype="text/event-stream")
+    # The 200 goes out before the outcome is known (it may end in an error event),
+    # and the name is in the POST body, so the stream must never be reused
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
+@app.route("/process_batch", methods=["POST"])
+def process_batch():
+    """
+    Generates ice-breaker content for several names in one request.
+
+    Expects {"names": [...]} with at most MAX_BATCH_SIZE non-empty strings and
+    returns a JSON array of payloads (the same shape as the final /process
+    result) in the order the names were given. A name that could not be
+    processed gets {"name": ..., "error": ...} in its place.
+    """
+    data = request.get_json(silent=True)
+    names = data.get("names") if isinstance(data, dict) else None
+    if not isinstance(names, list) or not all(isinstance(name, str) and name.strip() for name in names):
+        abort(400, description='Expected a JSON body like {"names": ["..."]}')
+    if len(names) > MAX_BATCH_SIZE:
+        abort(400, description=f"At most {MAX_BATCH_SIZE} names per batch")
+
+    payloads = []
+    for name, result in zip(names, ice_break_with_batch(names)):
+        if isinstance(result, Exception):
+            app.logger.warning("Ice breaker failed for %r: %s", name, result)
+            payloads.append({"name": name, "error": "Could not generate ice breaker content"})
+        else:
+            payloads.append(build_payload(*result))
+
+    return json_response(payloads)
+
+
+def _generate_events(name: str):
+    # The 200 status is sent with the first frame, so from here on failures
+    # (no profile, LLM error, empty or invalid stream) become an error event
+    try:
+        cached = get_cached_result(name)
+        if cached is not None:
+            yield sse_event("result", build_payload(*cached))
+            return
+        yield from _generate_fresh_events(name)
+    except Exception:
+        app.logger.exception("Ice breaker failed for %r", name)
+        yield sse_event("error", {"message": "Could not generate ice breaker content"})
+
+
+def _generate_fresh_events(name: str):
+    linkedin_data = fetch_linkedin_data(name)
+    photo_url = linkedin_data.get("photoUrl")
+    yield sse_event("profile", {"picture_url": photo_url or PLACEHOLDER_PICTURE_URL})
+
+    # Forward partial summaries while the LLM is still generating
+    summary_fields = {}
+    for summary_fields in stream_summary(linkedin_data):
+        yield sse_event("summary", summary_fields)
+
+    summary = Summary(**summary_fields)
+    store_result(name, summary, photo_url)
+    yield sse_event("result", build_payload(summary, photo_url))
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=8080, debug=True)
-    
\ No newline at end of file
+    # Development server only; use `gunicorn app:app` (see gunicorn.conf.py) in production
+    app.run(host="0.0.0.0", port=8080)
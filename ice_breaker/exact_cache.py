@@ -0,0 +1,113 @@
+"""
+Exact-Match Ice Breaker Cache
+
+This module caches the final output of the ice-breaker pipeline so that repeat
+requests for the same person skip the agent, the scraper and the LLM entirely.
+Every stage of the pipeline is a network round-trip (Tavily, Scrapin.io, OpenAI),
+so a cache hit turns a multi-second request into a dictionary lookup.
+
+Caching Layers:
+1. Memory: A bounded LRU dictionary that serves hits within the same process
+2. Disk: A diskcache store that survives restarts and is shared across processes
+
+Key Design:
+- Names are normalized (whitespace collapsed, case folded) before lookup
+- Disk keys are SHA-256 digests of the normalized name
+- Values are stored as plain dicts so cached entries survive model changes
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import diskcache
+
+from output_parsers import Summary
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalizes a person's name so trivially different spellings share a cache key.
+
+    Args:
+        name (str): Name as typed by the user
+
+    Returns:
+        str: Name with surrounding/repeated whitespace removed and case folded
+    """
+    return " ".join(name.split()).casefold()
+
+
+class ExactCache:
+    """
+    Two-level (memory + disk) cache of ice-breaker results keyed by normalized name.
+
+    Usage:
+        cache = ExactCache()
+        cached = cache.get("Yannick Folla")
+        if cached is None:
+            cache.set("Yannick Folla", summary, photo_url)
+    """
+
+    def __init__(self, directory: str = "./.icebreaker_cache", maxsize: int = 1024):
+        # In-process LRU layer; guarded by a lock because Flask serves requests on threads
+        self._memory: "OrderedDict[str, Tuple[Summary, Optional[str]]]" = OrderedDict()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+
+        # Persistent layer shared by every process pointing at the same directory
+        self._disk = diskcache.Cache(directory)
+
+    @staticmethod
+    def _disk_key(name_norm: str) -> str:
+        return hashlib.sha256(name_norm.encode("utf-8")).hexdigest()
+
+    def get(self, name: str) -> Optional[Tuple[Summary, Optional[str]]]:
+        """
+        Looks up a cached ice-breaker result.
+
+        Args:
+            name (str): Full name of the person (normalized internally)
+
+        Returns:
+            Optional[Tuple[Summary, str]]: Cached summary and photo URL, or None on a miss
+        """
+        name_norm = normalize_name(name)
+
+        # Memory hit: refresh recency and return
+        with self._lock:
+            if name_norm in self._memory:
+                self._memory.move_to_end(name_norm)
+                return self._memory[name_norm]
+
+        # Disk hit: rebuild the Summary and promote it to memory
+        stored = self._disk.get(self._disk_key(name_norm))
+        if stored is None:
+            return None
+
+        summary_dict, photo_url = stored
+        result = (Summary(**summary_dict), photo_url)
+        self._remember(name_norm, result)
+        return result
+
+    def set(self, name: str, summary: Summary, photo_url: Optional[str]) -> None:
+        """
+        Stores an ice-breaker result in both cache layers.
+
+        Args:
+            name (str): Full name of the person (normalized internally)
+            summary (Summary): Structured summary produced by the LLM chain
+            photo_url (str): Profile photo URL extracted from LinkedIn data
+        """
+        name_norm = normalize_name(name)
+        self._disk.set(self._disk_key(name_norm), (summary.model_dump(), photo_url))
+        self._remember(name_norm, (summary, photo_url))
+
+    def _remember(self, name_norm: str, result: Tuple[Summary, Optional[str]]) -> None:
+        # Insert into the LRU layer, evicting the least recently used entry when full
+        with self._lock:
+            self._memory[name_norm] = result
+            self._memory.move_to_end(name_norm)
+            if len(self._memory) > self._maxsize:
+                self._memory.popitem(last=False)
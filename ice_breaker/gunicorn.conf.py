@@ -0,0 +1,33 @@
+"""
+Gunicorn Configuration
+
+Production server settings for the Flask app. Every request spends nearly all
+of its time waiting on Tavily, Scrapin.io and OpenAI, so a few processes with
+many threads each (gthread workers) serve far more concurrent users than the
+single-threaded development server.
+
+Usage:
+    gunicorn app:app
+
+preload_app imports the app (LLM clients, ReAct prompt, caches, FAISS index)
+once in the master before forking, so workers share that memory copy-on-write.
+This is only safe because nothing in the app persists state on exit: the master
+outlives its workers, so an exit hook registered at import would run last and
+overwrite what the workers wrote. Every cache writes through to a diskcache
+store as entries are added instead, and diskcache reopens its SQLite connection
+in each forked worker.
+"""
+
+bind = "0.0.0.0:8080"
+
+# Process/thread layout for an I/O-bound workload
+workers = 2
+worker_class = "gthread"
+threads = 32
+
+# Import the app once in the master before forking workers
+# (no atexit/shutdown persistence in the app; see the module docstring)
+preload_app = True
+
+# Uncached requests chain several network round-trips; allow them to finish
+timeout = 60
@@ -4,94 +4,335 @@ Ice Breaker Main Module
 This module orchestrates the complete ice-breaker generation process using LangChain.
 It demonstrates several key LangChain patterns:
 1. Chain Pattern: Linear processing pipeline using the | operator
-2. Structured Output: Pydantic-based output parsing for reliable data extraction
+2. Structured Output: Provider-enforced JSON schema from a Pydantic model
 3. Multi-LLM Support: Easy switching between different language models
 4. Agent Integration: Uses ReAct agent for complex URL discovery
+5. Batch Execution: Several names share a thread pool and the chain's batch API
+6. Streaming: Partial summaries are parsed while the LLM is still generating
 
 Architecture Flow:
 Name Input → LinkedIn URL Discovery (Agent) → Data Scraping → LLM Processing → Structured Output
 """
 
-from langchain_core.prompts import PromptTemplate
+from langchain_core.prompts import PromptTemplate, ChatPromptTemplate
+from langchain_core.messages import SystemMessage
 from langchain_openai import ChatOpenAI
-from langchain_ollama import ChatOllama
-from langchain_core.output_parsers import StrOutputParser 
-from dotenv import load_dotenv
+from langchain_anthropic import ChatAnthropic
 from linkedin import scrape_linkedin_profile
 from agents.linkedin_lookup_agent import lookup as linkedin_lookup_agent
-from output_parsers import summary_output_parser, Summary
+from output_parsers import Summary, SUMMARY_JSON_SCHEMA
+from exact_cache import ExactCache, normalize_name
+from semantic_cache import SemanticCache
 import os
-from typing import Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+# Exact-Match Result Cache
+# Repeat requests for the same (normalized) name skip the whole pipeline
+ice_break_cache = ExactCache()
+
+# Semantic Result Cache
+# Near-duplicate spellings of a name ("yannick  folla", "Yannick J. Folla") share results
+semantic_ice_break_cache = SemanticCache()
+
+# Summary Task Instructions
+# Identical for every person, so it leads the prompt (see _build_summary_chain on caching)
+SUMMARY_TASK = (
+    "Given the LinkedIn information below about a person, I want you to create "
+    "a short summary of 2-3 sentences that includes two interesting facts about them."
+)
+
+# Batch Concurrency
+# Upper bound on simultaneous Tavily/Scrapin/LLM requests made for one batch
+_BATCH_CONCURRENCY = 8
 
-load_dotenv()
 
 def ice_break_with(name: str) -> Tuple[Summary, str]:
     """
     Main function that generates ice-breaker content for a given person.
-    
-    This function demonstrates the LangChain chain pattern where data flows through
-    multiple processing stages: Agent → Scraper → LLM → Parser
-    
+
+    Results are cached by normalized name (memory + disk) and by name embedding,
+    so repeat and near-duplicate requests return without any agent, scraping or
+    LLM calls.
+
     Args:
         name (str): Full name of the person to generate ice-breaker content for
-        
+
     Returns:
         Tuple[Summary, str]: Structured summary object and profile photo URL
-        
-    LangChain Patterns Used:
-    - Agent-based URL discovery with ReAct pattern
-    - Chain composition using | operator
-    - Structured output parsing with Pydantic
-    - Prompt templating with variable substitution
     """
-    
-    # Step 1: Use ReAct Agent to find LinkedIn profile URL
-    # The agent uses web search tools and multi-step reasoning to locate the profile
-    linkedin_username = linkedin_lookup_agent(name=name)
-    
-    # Step 2: Extract profile data from LinkedIn
-    # This provides raw data that will be processed by the LLM
-    linkedin_data = scrape_linkedin_profile(linkedin_profile_url=linkedin_username)
-    
-    # Step 3: Initialize Language Model
-    # Using OpenAI's GPT-4o-mini with deterministic output (temperature=0)
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
-    # Alternative: Local Ollama model (uncomment to use)
-    # llm = ChatOllama(model="llama3.3:latest")
+    cached = get_cached_result(name)
+    if cached is not None:
+        return cached
+
+    summary, photo_url = _run_ice_break_pipeline(name)
+    store_result(name, summary, photo_url)
+    return summary, photo_url
 
-    # Step 4: Create Structured Prompt Template
-    # The template includes format instructions from the Pydantic parser
-    # This ensures the LLM knows exactly what structure to return
-    summary_template = """
-          given the LinkedIn information {information} about a person, I want you to create a short summary of 2-3 sentences that includes two interesting facts about them.
-          \n{format_instructions}
+
+def ice_break_with_batch(names: List[str]) -> List[Union[Tuple[Summary, str], Exception]]:
     """
+    Generates ice-breaker content for several people at once.
+
+    Cached names are answered directly. For the rest, the URL lookups and scrapes
+    run on a small thread pool, and the summaries go through the chain's batch
+    API so the LLM requests are issued concurrently as well. Names that normalize
+    to the same key are only generated once.
+
+    A name that cannot be resolved, scraped or summarized does not fail the
+    batch: its slot holds the exception instead of a result.
+
+    Args:
+        names (List[str]): Full names of the people, in the desired output order
+
+    Returns:
+        List[Union[Tuple[Summary, str], Exception]]: One (summary, photo URL) pair
+        or exception per name, same order
+    """
+    # Duplicate spellings ("Yannick Folla", "yannick  folla") share one pipeline run
+    unique_names: Dict[str, str] = {}
+    for name in names:
+        unique_names.setdefault(normalize_name(name), name)
+
+    results: Dict[str, Union[Tuple[Summary, str], Exception, None]] = {
+        key: get_cached_result(name) for key, name in unique_names.items()
+    }
+    pending = [key for key, result in results.items() if result is None]
+
+    if pending:
+        # Fan out the I/O-bound stages: N round-trips cost roughly N / _BATCH_CONCURRENCY
+        # round-trips of wall time, without opening an unbounded number of connections
+        with ThreadPoolExecutor(max_workers=_BATCH_CONCURRENCY) as pool:
+            fetched = list(pool.map(_fetch_linkedin_data_or_error, [unique_names[key] for key in pending]))
+
+        scraped = []
+        for key, linkedin_data in zip(pending, fetched):
+            if isinstance(linkedin_data, Exception):
+                results[key] = linkedin_data
+            else:
+                scraped.append((key, linkedin_data))
+
+        summaries = _SUMMARY_CHAIN.batch(
+            [{"information": linkedin_data} for _, linkedin_data in scraped],
+            config={"max_concurrency": _BATCH_CONCURRENCY},
+            return_exceptions=True,
+        )
+
+        for (key, linkedin_data), summary in zip(scraped, summaries):
+            if isinstance(summary, Exception):
+                results[key] = summary
+                continue
+            photo_url = linkedin_data.get("photoUrl")
+            store_result(unique_names[key], summary, photo_url)
+            results[key] = (summary, photo_url)
+
+    return [results[normalize_name(name)] for name in names]
+
+
+def get_cached_result(name: str) -> Optional[Tuple[Summary, str]]:
+    """
+    Returns a previously generated result for this name, if any.
+
+    Args:
+        name (str): Full name of the person
+
+    Returns:
+        Optional[Tuple[Summary, str]]: Cached summary and photo URL, or None on a miss
+    """
+    # Exact hit first; it is a dictionary (or single disk) lookup
+    cached = ice_break_cache.get(name)
+    if cached is not None:
+        return cached
+
+    # Near-duplicate hit: deliberately not copied into the exact cache, so a
+    # false positive ("Michael B. Jordan" for "Michael Jordan") never becomes a
+    # permanent exact hit for the wrong person
+    return semantic_ice_break_cache.get(name)
+
+
+def store_result(name: str, summary: Summary, photo_url: Optional[str]) -> None:
+    """
+    Records a generated result in the exact-match and semantic caches.
+
+    Args:
+        name (str): Full name of the person
+        summary (Summary): Structured summary produced by the LLM chain
+        photo_url (str): Profile photo URL extracted from LinkedIn data
+    """
+    ice_break_cache.set(name, summary, photo_url)
+    semantic_ice_break_cache.add(name, summary, photo_url)
+
+
+def _build_summary_chain(schema):
+    """
+    Builds the prompt → structured llm chain that turns LinkedIn data into a summary.
+
+    The model runs in strict native structured-output mode for both schema
+    forms, so the provider enforces the schema server-side (also while
+    streaming) and the prompt carries no format instructions.
+    Static content still comes first (task, then LinkedIn data). Note that this
+    shared prefix is only ~40 tokens, far below the minimum OpenAI (1024 tokens)
+    and Anthropic (1024-2048 tokens) need before they cache anything, so the
+    caching hints below have no effect until the static instructions grow
+    past that size; requests under the minimum are simply processed uncached.
+
+    Args:
+        schema: Summary (returns validated Summary objects) or SUMMARY_JSON_SCHEMA
+            (returns dicts, parsed incrementally when streaming)
+
+    Returns:
+        Runnable: Chain accepting {"information": linkedin_data}
+    """
+
+    # Initialize Language Model
+    # Using OpenAI's GPT-4o-mini with deterministic output (temperature=0)
+    # prompt_cache_key (sent via extra_body so it reaches the API whatever the
+    # openai SDK version) would route calls sharing a cacheable prefix together
+    # with_structured_output sends the schema as a json_schema response_format;
+    # strict=True is required for the dict schema used when streaming, which
+    # LangChain would otherwise send with "strict": false (unconstrained)
+    llm = ChatOpenAI(
+        model="gpt-4o-mini",
+        temperature=0,
+        extra_body={"prompt_cache_key": "icebreaker-summary-v1"},
+    ).with_structured_output(schema, method="json_schema", strict=True)
+    # Alternative: Local Ollama model (uncomment to use, with `from langchain_ollama import ChatOllama`)
+    # llm = ChatOllama(model="llama3.3:latest").with_structured_output(schema)
+
+    # Create Prompt Template
+    # The static task comes first so it forms a shared prefix;
+    # the per-person LinkedIn data is the only part that changes between calls
+    summary_template = """{summary_task}
+
+Information:
+{information}
+"""
 
     # Create PromptTemplate with both dynamic variables and partial variables
     # - input_variables: Values provided at runtime (information)
-    # - partial_variables: Values set at template creation (format_instructions)
+    # - partial_variables: Values set at template creation (summary_task)
     summary_prompt_template = PromptTemplate(
         input_variables=["information"],
         template=summary_template,
-        partial_variables={"format_instructions": summary_output_parser.get_format_instructions()},
+        partial_variables={"summary_task": SUMMARY_TASK},
     )
 
-    # Step 5: Build LangChain Processing Chain
-    # Chain Pattern: prompt → llm → parser
-    # Each step processes and transforms the data for the next step
-    chain = summary_prompt_template | llm  | summary_output_parser
+    # Build LangChain Processing Chain
+    # Chain Pattern: prompt → structured llm (schema validation happens in the model wrapper)
+    summary_chain = summary_prompt_template | llm
+
+    # Optional Anthropic Fallback
+    # Anthropic only caches prefixes explicitly marked with cache_control, so the
+    # static instructions go in their own system block flagged as ephemeral
+    # (inert for now: Haiku needs a 2048-token prefix and this one is ~40)
+    if os.getenv("ANTHROPIC_API_KEY"):
+        anthropic_prompt_template = ChatPromptTemplate.from_messages([
+            SystemMessage(content=[{
+                "type": "text",
+                "text": SUMMARY_TASK,
+                "cache_control": {"type": "ephemeral"},
+            }]),
+            ("human", "Information:\n{information}"),
+        ])
+        anthropic_llm = ChatAnthropic(
+            model="claude-3-5-haiku-latest", temperature=0
+        ).with_structured_output(schema)
+        summary_chain = summary_chain.with_fallbacks(
+            [anthropic_prompt_template | anthropic_llm]
+        )
+
+    return summary_chain
+
+
+# Summary Chains (built once at import)
+# The prompt and the LLM clients are identical for every call
+# - _SUMMARY_CHAIN returns a validated Summary
+# - _SUMMARY_STREAM_CHAIN yields partial dicts as tokens arrive
+_SUMMARY_CHAIN = _build_summary_chain(Summary)
+_SUMMARY_STREAM_CHAIN = _build_summary_chain(SUMMARY_JSON_SCHEMA)
+
+
+def fetch_linkedin_data(name: str) -> dict:
+    """
+    Finds a person's LinkedIn profile and scrapes it (agent → scraper).
+
+    Args:
+        name (str): Full name of the person
+
+    Returns:
+        dict: Cleaned LinkedIn profile data ready for LLM processing
+
+    Raises:
+        ValueError: If no profile URL is found or the scraper returns no person data
+    """
+    linkedin_username = linkedin_lookup_agent(name=name)
+    if not linkedin_username:
+        # Scraping an empty URL would only spend an API call on an error response
+        raise ValueError(f"No LinkedIn profile found for {name!r}")
+    return scrape_linkedin_profile(linkedin_profile_url=linkedin_username)
+
+
+def _fetch_linkedin_data_or_error(name: str) -> Union[dict, Exception]:
+    # Per-name failures are returned rather than raised so one bad name can't sink a batch
+    try:
+        return fetch_linkedin_data(name)
+    except Exception as e:
+        return e
+
+
+def stream_summary(linkedin_data: dict) -> Iterator[dict]:
+    """
+    Streams the summary for already-scraped LinkedIn data as it is generated.
+
+    Each yielded dict is the JSON parsed so far, e.g. {"summary": "Yannick is"}
+    early on and the complete {"summary": ..., "facts": [...]} at the end, so
+    callers can render the summary while the facts are still being written.
+
+    Args:
+        linkedin_data (dict): Cleaned LinkedIn profile data
+
+    Yields:
+        dict: Progressively more complete summary fields
+    """
+    yield from _SUMMARY_STREAM_CHAIN.stream({"information": linkedin_data})
+
 
-    # Step 6: Execute the Chain
-    # The chain processes: template filling → LLM generation → structured parsing
-    result: Summary = chain.invoke({"information": linkedin_data})
+def _run_ice_break_pipeline(name: str) -> Tuple[Summary, str]:
+    """
+    Runs the full ice-breaker pipeline for a given person, bypassing the cache.
+
+    This function demonstrates the LangChain chain pattern where data flows through
+    multiple processing stages: Agent → Scraper → Structured LLM
+
+    Args:
+        name (str): Full name of the person to generate ice-breaker content for
 
-    # Step 7: Return structured results
+    Returns:
+        Tuple[Summary, str]: Structured summary object and profile photo URL
+
+    LangChain Patterns Used:
+    - Agent-based URL discovery with ReAct pattern
+    - Chain composition using | operator
+    - Native structured output with a Pydantic schema
+    - Prompt templating with variable substitution
+    """
+
+    # Steps 1-2: Use ReAct Agent to find the LinkedIn profile URL, then scrape it
+    # The agent uses web search tools and multi-step reasoning to locate the profile;
+    # the scraper provides raw data that will be processed by the LLM
+    linkedin_data = fetch_linkedin_data(name)
+
+    # Step 3: Execute the Chain
+    # The chain processes: template filling → schema-constrained LLM generation
+    result: Summary = _SUMMARY_CHAIN.invoke({"information": linkedin_data})
+
+    # Step 4: Return structured results
     # Extract profile photo URL from LinkedIn data (fallback handled in Flask app)
     return result, linkedin_data.get("photoUrl")
 
 
 if __name__ == "__main__":
     print("Hello, Langchain!")
-    
+
     # Example usage: Generate ice-breaker content
-    print(ice_break_with(name="Yannick Folla"))
\ No newline at end of file
+    print(ice_break_with(name="Yannick Folla"))
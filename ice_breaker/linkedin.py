@@ -14,16 +14,49 @@ Data Flow Integration:
 Key Features:
 - Mock data support for development/testing
 - Production API integration with Scrapin.io
+- Pooled, retrying HTTP session shared across requests
 - Data cleaning and filtering
 - Structured output for LLM consumption
 """
 
 import os
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Mock data is hosted on GitHub Gist for easy access and updates
+MOCK_PROFILE_URL = "https://gist.githubusercontent.com/YFolla/ff1954753eb6354728a292e77ee10795/raw/b177fcc64b7308b8b3a81eddbbb09bf647ed19c6/yfolla_linkedin.json"
+
+# Scrapin.io provides LinkedIn profile data through their API
+SCRAPIN_API_ENDPOINT = "https://api.scrapin.io/enrichment/profile"
+
+# Profile fields that are noise for the summary prompt
+_DROP = frozenset({"certifications"})
+
+# Pooled HTTP Session
+# Reusing keep-alive connections skips the TCP + TLS handshake on every scrape;
+# transient rate-limit and server errors are retried with a short backoff.
+# Every caller (CLI, /process and /process_batch threads) shares this one pool,
+# which is sized above the gunicorn thread count so requests never queue on it.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
+
+
 def scrape_linkedin_profile(linkedin_profile_url: str, mock: bool = False):
     """
     Scrapes LinkedIn profile information for a given profile URL.
@@ -39,6 +72,9 @@ def scrape_linkedin_profile(linkedin_profile_url: str, mock: bool = False):
     Returns:
         dict: Cleaned LinkedIn profile data ready for LLM processing
         
+    Raises:
+        ValueError: If the API response contains no person data
+        
     Data Pipeline Role:
     - Provides structured input for LangChain LLM processing
     - Filters out irrelevant/empty fields to reduce token usage
@@ -48,42 +84,55 @@ def scrape_linkedin_profile(linkedin_profile_url: str, mock: bool = False):
     - Mock: Uses GitHub Gist with sample LinkedIn data (for development)
     - Production: Uses Scrapin.io API for real LinkedIn profile scraping
     """
-    
+    url, params = _build_request(linkedin_profile_url, mock)
+    response = _SESSION.get(url, params=params, timeout=10)
+    return _clean_profile(response.content)
+
+
+def _build_request(linkedin_profile_url: str, mock: bool):
+    """
+    Returns the (url, query params) pair for a profile request.
+    """
     if mock:
         # Development Mode: Use Mock Data
         # This allows testing the LangChain pipeline without API costs or rate limits
-        # Mock data is hosted on GitHub Gist for easy access and updates
-        linkedin_profile_url = "https://gist.githubusercontent.com/YFolla/ff1954753eb6354728a292e77ee10795/raw/b177fcc64b7308b8b3a81eddbbb09bf647ed19c6/yfolla_linkedin.json"
-        response = requests.get(linkedin_profile_url, timeout=10)
-    
-    else: 
-        # Production Mode: Use Real LinkedIn Scraping API
-        # Scrapin.io provides LinkedIn profile data through their API
-        # Requires API key stored in environment variables
-        api_endpoint = "https://api.scrapin.io/enrichment/profile"
-        params = {
-            "apikey": os.getenv("SCRAPIN_API_KEY"),
-            "linkedInUrl": linkedin_profile_url,
-        }
-        response = requests.get(api_endpoint, params=params, timeout=10)
+        return MOCK_PROFILE_URL, None
+
+    # Production Mode: Use Real LinkedIn Scraping API
+    # Requires API key stored in environment variables
+    params = {
+        "apikey": os.getenv("SCRAPIN_API_KEY"),
+        "linkedInUrl": linkedin_profile_url,
+    }
+    return SCRAPIN_API_ENDPOINT, params
+
+
+def _clean_profile(content: bytes) -> dict:
+    """
+    Parses a scraping API response body and cleans the person data in one pass.
     
+    Raises:
+        ValueError: If the response has no person object
+    """
     # Extract Person Data from API Response
+    # orjson parses the raw body directly (no intermediate str decode)
     # Most LinkedIn scraping APIs wrap the profile data in a "person" object
-    data = response.json().get("person")
+    person = orjson.loads(content).get("person")
+    if not person:
+        # Unknown or unreachable profiles come back without a person object
+        raise ValueError("Scraping API returned no person data")
     
     # Clean and Filter Data for LLM Processing
     # This reduces token usage and improves LLM focus by:
-    # 1. Removing empty/null values that don't add information
+    # 1. Removing empty/falsy values that don't add information
     # 2. Filtering out noisy fields like certifications
     # 3. Keeping only relevant profile information
-    data = {
+    return {
         k: v
-        for k, v in data.items()
-        if v not in ([], "", None)           # Remove empty values
-        and k not in ["certifications"]      # Remove noisy fields
+        for k, v in person.items()
+        if v                                 # Remove empty values ([], "", None, {}, 0, False)
+        and k not in _DROP                   # Remove noisy fields
     }
-    
-    return data
 
 if __name__ == "__main__":
     """
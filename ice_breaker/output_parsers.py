@@ -1,27 +1,26 @@
 """
-LangChain Output Parsers Module
+LangChain Output Schemas Module
 
-This module implements structured output parsing using Pydantic models, which is
+This module defines the structured output schema used for LLM responses, which is
 a crucial pattern in LangChain for ensuring reliable, consistent LLM responses.
 
-Without structured parsing, LLM outputs can be unpredictable in format, making
+Without structured output, LLM outputs can be unpredictable in format, making
 them difficult to use in applications. This module solves that by:
 
 1. Defining exact output schemas using Pydantic
-2. Providing format instructions to the LLM
-3. Parsing and validating LLM responses
+2. Handing the schema to the provider's native structured-output mode
+3. Validating LLM responses against the schema
 4. Ensuring type safety and data consistency
 
 Key LangChain Patterns:
-- Pydantic Output Parsing: Structured data extraction from LLM responses
+- Structured Output: with_structured_output() binds the schema to the model
 - Schema Validation: Automatic validation of LLM outputs
-- Format Instructions: Teaching LLMs how to structure their responses
+- Server-Side Enforcement: The provider guarantees schema-conformant JSON
 - Type Safety: Strong typing for reliable application integration
 """
 
-from typing import List, Dict, Any
-from langchain_core.output_parsers import PydanticOutputParser
-from pydantic import BaseModel, Field
+from typing import List
+from pydantic import BaseModel, ConfigDict, Field
 
 class Summary(BaseModel):
     """
@@ -31,18 +30,25 @@ class Summary(BaseModel):
     1. Schema Definition: Defines exactly what fields the LLM should return
     2. Validation: Automatically validates LLM responses match the schema
     3. Type Safety: Provides strong typing for the application
-    4. Format Instructions: Generates instructions for the LLM
+    4. Response Format: Becomes the JSON schema sent to the provider
     
     Fields:
         summary (str): 2-3 sentence summary of the person
         facts (List[str]): List of interesting facts about the person
         
     LangChain Integration:
-    - Used by PydanticOutputParser to validate LLM responses
-    - Automatically generates format instructions for prompts
+    - Passed to with_structured_output to constrain and validate LLM responses
+    - Automatically converted to the provider's JSON schema response format
     - Ensures consistent output structure across all LLM calls
+    
+    Serialization:
+    - Use the built-in (Rust-backed) model_dump() / model_dump_json()
     """
     
+    # Immutable and strict: summaries are never edited after generation, and
+    # unknown fields are rejected (the schema also gets additionalProperties: false)
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     # Primary summary field with descriptive metadata
     # The Field description helps both developers and the LLM understand the purpose
     summary: str = Field(description="summary of the person")
@@ -51,60 +57,37 @@ class Summary(BaseModel):
     # Using List[str] ensures each fact is a separate string element
     facts: List[str] = Field(description="interesting facts about the person")
 
-    def to_dict(self) -> Dict[str, Any]:
-        """
-        Convert the Pydantic model to a dictionary for JSON serialization.
-        
-        This method provides a clean interface for converting the structured
-        LLM output to formats needed by web APIs, databases, or other systems.
-        
-        Returns:
-            Dict[str, Any]: Dictionary representation of the summary data
-            
-        Usage:
-        - Flask API responses
-        - Database storage
-        - Frontend JavaScript consumption
-        """
-        return {"summary": self.summary, "facts": self.facts}
-
-# Global Output Parser Instance
-# This parser is used throughout the application to ensure consistent LLM output formatting
-summary_output_parser = PydanticOutputParser(pydantic_object=Summary)
+# JSON Schema for Streaming
+# Passing a plain dict schema (rather than the Pydantic class) to
+# with_structured_output makes the chain yield partial dicts while streaming
+SUMMARY_JSON_SCHEMA = Summary.model_json_schema()
 
 """
-How PydanticOutputParser Works:
+How Structured Output Works:
 
-1. Format Instructions Generation:
-   - Calls summary_output_parser.get_format_instructions()
-   - Returns detailed JSON schema instructions for the LLM
-   - Instructions are injected into prompt templates
+1. Schema Binding:
+   - llm.with_structured_output(Summary) converts the model to a JSON schema
+   - The schema is sent as the request's response_format, not as prompt text
+   - No format instructions are needed in the prompt
 
 2. LLM Response Processing:
-   - LLM generates response following the provided format
-   - Parser validates response matches Summary schema
-   - Converts raw text to Summary object with type safety
-
-3. Error Handling:
-   - Automatically handles parsing errors
-   - Provides clear error messages for debugging
-   - Ensures application stability with malformed LLM responses
+   - The provider constrains generation to the schema server-side
+   - LangChain validates the JSON against Summary
+   - Converts the response to a Summary object with type safety
 
-Example Generated Format Instructions:
-"The output should be formatted as a JSON instance that conforms to the JSON schema below.
+3. Streaming:
+   - With SUMMARY_JSON_SCHEMA (a dict), partial JSON is parsed as tokens arrive
+   - Callers see {"summary": "..."} before the facts list is complete
 
+Example Generated Schema:
 {
-  "$defs": {
-    "Summary": {
-      "properties": {
-        "summary": {"description": "summary of the person", "title": "Summary", "type": "string"},
-        "facts": {"description": "interesting facts about the person", "items": {"type": "string"}, "title": "Facts", "type": "array"}
-      },
-      "required": ["summary", "facts"],
-      "title": "Summary",
-      "type": "object"
-    }
-  }
-}"
+  "properties": {
+    "summary": {"description": "summary of the person", "title": "Summary", "type": "string"},
+    "facts": {"description": "interesting facts about the person", "items": {"type": "string"}, "title": "Facts", "type": "array"}
+  },
+  "required": ["summary", "facts"],
+  "additionalProperties": false,
+  "title": "Summary",
+  "type": "object"
+}
 """
-
@@ -0,0 +1,148 @@
+"""
+Semantic Ice Breaker Cache
+
+This module catches near-duplicate lookups that the exact-match cache misses.
+Users type "Yannick Folla", "yannick  folla" or "Yannick J. Folla" for the same
+person; embedding the name and searching previously seen names by cosine
+similarity lets all of them share one cached profile.
+
+How It Works:
+1. Embed: Names are encoded locally with all-MiniLM-L6-v2 (384-d, L2-normalized)
+2. Search: A FAISS inner-product index returns the closest previously seen name;
+   vectors are stored as 8-bit scalar-quantized codes (384 B instead of 1536 B)
+3. Hit: If the similarity clears the threshold, the stored result is returned
+4. Miss: The caller runs the pipeline and adds the new name and result
+5. Persist: Every added entry is appended to a diskcache store shared by all
+   processes; each process replays entries it hasn't seen into its own index
+
+Because the vectors are L2-normalized, inner product equals cosine similarity.
+The store is the single source of truth and is only ever appended to inside a
+transaction, so concurrent workers never overwrite each other's entries and an
+index position always refers to the same result in every process.
+"""
+
+import os
+import threading
+from typing import List, Optional, Tuple
+
+import diskcache
+import faiss
+import numpy as np
+from sentence_transformers import SentenceTransformer
+
+from exact_cache import normalize_name
+from output_parsers import Summary
+
+
+class SemanticCache:
+    """
+    Embedding-based cache of ice-breaker results for near-duplicate names.
+
+    Usage:
+        cache = SemanticCache()
+        cached = cache.get("yannick j. folla")
+        if cached is None:
+            cache.add("Yannick Folla", summary, photo_url)
+    """
+
+    def __init__(
+        self,
+        directory: str = "./.icebreaker_cache",
+        threshold: float = 0.92,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+    ):
+        # Local embedding model: no network call on the lookup path
+        self._model = SentenceTransformer(model_name)
+        self._dimension = self._model.get_sentence_embedding_dimension()
+        self._threshold = threshold
+
+        # Shared append-only log: "count" plus one "entry:<position>" per added name;
+        # eviction is off because a dropped entry would leave a gap in the positions
+        self._store = diskcache.Cache(os.path.join(directory, "semantic"), eviction_policy="none")
+
+        # FAISS ids are positions, so results live in a parallel list; both mirror
+        # the first len(self._entries) entries of the store
+        self._index = self._new_index()
+        self._entries: List[Tuple[dict, Optional[str]]] = []
+        self._lock = threading.Lock()
+
+        with self._lock:
+            self._sync()
+
+    def _new_index(self) -> faiss.Index:
+        # 8-bit scalar quantizer: one byte per dimension instead of a float32,
+        # which cuts memory and search bandwidth 4x with negligible recall loss
+        index = faiss.IndexScalarQuantizer(
+            self._dimension, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+        )
+        # Unit vectors lie in [-1, 1] on every axis; training on those bounds fixes
+        # the quantization range up front instead of learning it from cached names
+        bounds = np.stack([
+            np.full(self._dimension, -1.0, dtype=np.float32),
+            np.full(self._dimension, 1.0, dtype=np.float32),
+        ])
+        index.train(bounds)
+        return index
+
+    def _embed(self, name: str) -> np.ndarray:
+        # Shape (1, dimension), float32 and unit length as FAISS expects
+        vector = self._model.encode([normalize_name(name)], normalize_embeddings=True)
+        return np.asarray(vector, dtype=np.float32)
+
+    def get(self, name: str) -> Optional[Tuple[Summary, Optional[str]]]:
+        """
+        Returns the cached result of the most similar previously seen name.
+
+        Args:
+            name (str): Full name of the person
+
+        Returns:
+            Optional[Tuple[Summary, str]]: Cached summary and photo URL, or None
+            when no stored name clears the similarity threshold
+        """
+        vector = self._embed(name)
+
+        with self._lock:
+            # Pick up entries other workers have added since the last lookup
+            self._sync()
+            if self._index.ntotal == 0:
+                return None
+            scores, ids = self._index.search(vector, 1)
+            if scores[0][0] <= self._threshold:
+                return None
+            summary_dict, photo_url = self._entries[ids[0][0]]
+
+        return Summary(**summary_dict), photo_url
+
+    def add(self, name: str, summary: Summary, photo_url: Optional[str]) -> None:
+        """
+        Stores a result under the embedding of the given name.
+
+        Args:
+            name (str): Full name of the person
+            summary (Summary): Structured summary produced by the LLM chain
+            photo_url (str): Profile photo URL extracted from LinkedIn data
+        """
+        vector = self._embed(name)
+
+        # Reserve the next position and write the entry atomically across processes
+        with self._store.transact():
+            position = self._store.get("count", 0)
+            self._store.set(f"entry:{position}", (vector.tobytes(), summary.model_dump(), photo_url))
+            self._store.set("count", position + 1)
+
+        with self._lock:
+            self._sync()
+
+    def _sync(self) -> None:
+        # Replay store entries this process hasn't indexed yet (caller holds the lock)
+        count = self._store.get("count", 0)
+        if count <= len(self._entries):
+            return
+
+        vectors = []
+        for position in range(len(self._entries), count):
+            vector_bytes, summary_dict, photo_url = self._store[f"entry:{position}"]
+            vectors.append(np.frombuffer(vector_bytes, dtype=np.float32))
+            self._entries.append((summary_dict, photo_url))
+        self._index.add(np.stack(vectors))
@@ -14,8 +14,57 @@ Key Concepts:
 3. Agent Tool Usage: How agents can call these tools during reasoning
 """
 
+import re
+import threading
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
 from langchain_community.tools.tavily_search import TavilySearchResults
 
+# Load API keys before any client below is constructed
+# Every LLM/search entry point imports this module first, so this is the one
+# place the app needs it (linkedin.py keeps its own call for standalone use)
+load_dotenv()
+
+# Hyperscan (optional): SIMD regex scanning for bulk search-result text
+# No wheels are published for Windows, so fall back to the re module there
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# LinkedIn Profile URL Pattern
+# Matches public profile URLs such as https://www.linkedin.com/in/yannickfolla
+# The same expression is compiled for both engines so they return identical URLs
+_LINKEDIN_PROFILE_URL_PATTERN = rb"https?://([a-z]+\.)?linkedin\.com/in/[A-Za-z0-9_\-%]+"
+LINKEDIN_PROFILE_URL_RE = re.compile(_LINKEDIN_PROFILE_URL_PATTERN.decode())
+
+# Compiled Hyperscan Database (built once at import)
+# SOM_LEFTMOST makes each match report its start offset, not just its end
+if hyperscan is not None:
+    _LINKEDIN_PROFILE_URL_DB = hyperscan.Database()
+    _LINKEDIN_PROFILE_URL_DB.compile(
+        expressions=[_LINKEDIN_PROFILE_URL_PATTERN],
+        ids=[1],
+        elements=1,
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST],
+    )
+else:
+    _LINKEDIN_PROFILE_URL_DB = None
+
+# A database's scratch space can only serve one scan at a time
+_LINKEDIN_PROFILE_URL_DB_LOCK = threading.Lock()
+
+# Direct Profile Search
+# A few results give the URL filter more than one chance to find a profile hit
+_PROFILE_SEARCH = TavilySearchResults(max_results=3)
+
+# Agent Tool Search (built once at import)
+# Initialize Tavily Search Tool
+# max_results=1 keeps the response focused and reduces token usage
+# Tavily is designed for AI applications, so results are LLM-friendly
+_TAVILY = TavilySearchResults(max_results=1)
+
 def get_profile_url_tavily(name: str):
     """
     Searches for a person's LinkedIn profile URL using Tavily web search.
@@ -41,14 +90,66 @@ def get_profile_url_tavily(name: str):
     - Error handling: Tavily handles API errors and rate limiting
     """
     
-    # Initialize Tavily Search Tool
-    # max_results=1 keeps the response focused and reduces token usage
-    # Tavily is designed for AI applications, so results are LLM-friendly
-    search = TavilySearchResults(max_results=1)
-    
     # Execute Search with LinkedIn-Specific Query
     # The query format is optimized to find LinkedIn profiles specifically
     # Tavily will return structured results that include URLs, snippets, and metadata
-    result = search.run(f"{name} LinkedIn profile")
+    return _TAVILY.invoke(f"{name} LinkedIn profile")
+
+
+def find_linkedin_profile_urls(text: str) -> List[str]:
+    """
+    Extracts every LinkedIn profile URL from a block of text, in order.
+    
+    Uses Hyperscan's compiled DFA when it is installed and the re module otherwise.
+    
+    Args:
+        text (str): Search-result URLs/snippets to scan
+        
+    Returns:
+        List[str]: Matching profile URLs (empty if none)
+    """
+    if _LINKEDIN_PROFILE_URL_DB is None:
+        return [match.group(0) for match in LINKEDIN_PROFILE_URL_RE.finditer(text)]
+    
+    data = text.encode("utf-8")
+    
+    # Hyperscan reports a match at every end offset the pattern can reach;
+    # keeping the furthest end per start gives the same greedy URLs as re
+    spans: Dict[int, int] = {}
+    
+    def on_match(match_id, start, end, flags, context):
+        if end > spans.get(start, -1):
+            spans[start] = end
+    
+    with _LINKEDIN_PROFILE_URL_DB_LOCK:
+        _LINKEDIN_PROFILE_URL_DB.scan(data, match_event_handler=on_match)
+    
+    return [data[start:end].decode("utf-8") for start, end in sorted(spans.items())]
+
+
+def find_profile_url_tavily(name: str) -> Optional[str]:
+    """
+    Finds a LinkedIn profile URL with a single Tavily search and no LLM calls.
+    
+    The search is restricted to linkedin.com/in, so the first result is usually
+    the profile itself; the URLs are filtered with LINKEDIN_PROFILE_URL_RE.
+    
+    Args:
+        name (str): Full name of the person to search for
+        
+    Returns:
+        Optional[str]: First matching LinkedIn profile URL, empty string if the
+        search succeeded but nothing matched, or None if the search itself failed
+    """
+    results = _PROFILE_SEARCH.invoke(f"{name} site:linkedin.com/in")
+    return _first_profile_url(results)
+
+
+def _first_profile_url(results) -> Optional[str]:
+    # Tavily returns a list of {"url": ..., "content": ...} dicts, or repr() of the
+    # exception when the request failed (outage, 429); that is not a "no match"
+    if not isinstance(results, list):
+        return None
     
-    return result
\ No newline at end of file
+    urls = find_linkedin_profile_urls("\n".join(hit.get("url", "") for hit in results))
+    return urls[0] if urls else ""